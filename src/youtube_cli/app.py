@@ -1,19 +1,22 @@
 import asyncio
+import concurrent.futures
 import logging
 import sys
 import shutil
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
 from enum import Enum
-import json
 import threading
 
 # --- Dependency Check and Imports ---
 try:
     import yt_dlp
     import mpv
+    import orjson
+    import msgspec
     from textual.app import App, ComposeResult
     from textual.widgets import (
         Header, Footer, Input, DataTable, Static, ProgressBar,
@@ -48,80 +51,112 @@ class PlaybackState(Enum):
     BUFFERING = "Buffering"
     ERROR = "Error"
 
-@dataclass(slots=True)
-class VideoInfo:
+class VideoInfo(msgspec.Struct, frozen=True, gc=False):
     id: str
     title: str
     uploader: str
     duration: Optional[int]
-    url: str = field(init=False, repr=False)
+    url: str
+    formatted_duration: str
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any]) -> 'VideoInfo':
+        """Build from a yt-dlp search entry, deriving url and formatted_duration up front."""
+        video_id, duration = entry['id'], entry.get('duration')
+        return cls(
+            video_id, entry.get('title', 'N/A'), entry.get('uploader', 'N/A'), duration,
+            f"https://www.youtube.com/watch?v={video_id}", cls._format_duration(duration)
+        )
 
-    def __post_init__(self):
-        self.url = f"https://www.youtube.com/watch?v={self.id}"
-
-    @property
-    def formatted_duration(self) -> str:
-        if self.duration is None: return "N/A"
-        h, rem = divmod(self.duration, 3600)
+    @staticmethod
+    def _format_duration(duration: Optional[int]) -> str:
+        if duration is None: return "N/A"
+        h, rem = divmod(duration, 3600)
         m, s = divmod(rem, 60)
         return f"{int(h):02}:{int(m):02}:{int(s):02}" if h > 0 else f"{int(m):02}:{int(s):02}"
 
+class StreamInfo(msgspec.Struct, frozen=True):
+    """Direct stream URLs resolved ahead of playback by SearchEngine.prefetch."""
+    video_url: str
+    audio_url: Optional[str]
+    http_headers: Dict[str, str]
+    expires: Optional[float]
+
+    # Treat URLs as stale a little before googlevideo's own deadline.
+    EXPIRY_MARGIN = 60
+
+    @classmethod
+    def from_info(cls, info: Dict[str, Any]) -> Optional['StreamInfo']:
+        # Split video+audio selections report both streams in 'requested_formats'.
+        formats = [f for f in info.get('requested_formats') or [info] if f.get('url')]
+        if not formats: return None
+        urls = [f['url'] for f in formats]
+        # googlevideo URLs carry their deadline as an 'expire' query parameter.
+        deadlines = [float(v[0]) for v in (parse_qs(urlsplit(u).query).get('expire') for u in urls) if v]
+        return cls(
+            urls[0], urls[1] if len(urls) > 1 else None,
+            dict(formats[0].get('http_headers') or {}), min(deadlines) if deadlines else None
+        )
+
+    @property
+    def expired(self) -> bool:
+        return self.expires is not None and time.time() > self.expires - self.EXPIRY_MARGIN
+
 # --- Core Application State Management ---
 class AppState:
     """The thread-safe, single source of truth for the entire application state."""
     def __init__(self):
-        self._lock = threading.RLock()
+        self._queue_lock = threading.Lock()
         self.videos: List[VideoInfo] = []
         self.current_video_index: Optional[int] = None
         self._playback_state = PlaybackState.STOPPED
         self.position = 0.0
         self.duration = 0.0
-        self.search_cache: Dict[str, List[VideoInfo]] = {}
-        self.play_queue: List[VideoInfo] = []
+        self.search_cache: 'OrderedDict[str, List[VideoInfo]]' = OrderedDict()
+        self.stream_cache: 'OrderedDict[str, StreamInfo]' = OrderedDict()
+        self.play_queue: List[Tuple[int, VideoInfo]] = []
         self.focus_mode: str = "search"
         self.config = self._load_config()
         self._volume = self.config.get('volume', 100)
         self.autoplay_enabled = self.config.get('autoplay', True)
 
+    # Scalar fields are single reference stores, which are atomic under the GIL,
+    # so only the multi-step queue mutations need the lock.
     @property
     def volume(self) -> int:
-        with self._lock: return self._volume
+        return self._volume
 
     @property
     def playback_state(self) -> PlaybackState:
-        with self._lock: return self._playback_state
+        return self._playback_state
         
     def set_volume(self, value: int) -> bool:
-        with self._lock:
-            new_volume = max(0, min(100, value))
-            if self._volume != new_volume:
-                self._volume = new_volume
-                return True
-            return False
+        new_volume = max(0, min(100, value))
+        if self._volume != new_volume:
+            self._volume = new_volume
+            return True
+        return False
 
     def set_playback_state(self, new_state: PlaybackState) -> bool:
-        with self._lock:
-            if self._playback_state != new_state:
-                logger.info(f"State transition: {self._playback_state.name} -> {new_state.name}")
-                self._playback_state = new_state
-                return True
-            return False
+        if self._playback_state != new_state:
+            logger.info(f"State transition: {self._playback_state.name} -> {new_state.name}")
+            self._playback_state = new_state
+            return True
+        return False
 
     def set_position(self, new_position: float):
-        with self._lock:
-            self.position = new_position
+        self.position = new_position
             
     def set_duration(self, new_duration: float):
-        with self._lock:
-            if self.duration != new_duration:
-                self.duration = new_duration
+        if self.duration != new_duration:
+            self.duration = new_duration
                 
-    def add_to_queue(self, video: VideoInfo):
-        with self._lock:
-            self.play_queue.insert(0, video)
+    def add_to_queue(self, index: int, video: VideoInfo):
+        with self._queue_lock:
+            self.play_queue.insert(0, (index, video))
 
-    def get_next_from_queue(self) -> Optional[VideoInfo]:
-        with self._lock:
+    def get_next_from_queue(self) -> Optional[Tuple[int, VideoInfo]]:
+        with self._queue_lock:
             return self.play_queue.pop(0) if self.play_queue else None
 
     def _load_config(self) -> Dict[str, Any]:
@@ -133,9 +168,8 @@ class AppState:
         }
         if not config_path.exists(): return default_config
         try:
-            with config_path.open('r') as f:
-                return {**default_config, **json.load(f)}
-        except (json.JSONDecodeError, OSError) as e:
+            return {**default_config, **orjson.loads(config_path.read_bytes())}
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.warning(f"Config load failed: {e}. Using defaults.")
             return default_config
 
@@ -143,8 +177,7 @@ class AppState:
         config_path = Path.home() / '.youtube_cli' / 'config.json'
         config_to_save = {'volume': self.volume, 'autoplay': self.autoplay_enabled}
         try:
-            with config_path.open('w') as f:
-                json.dump(config_to_save, f, indent=4)
+            config_path.write_bytes(orjson.dumps(config_to_save, option=orjson.OPT_INDENT_2))
         except OSError as e:
             logger.error(f"Failed to save config: {e}")
 
@@ -160,6 +193,15 @@ class VideoPlayer:
         self.state = state
         self.app = app
         self.player: Optional[mpv.MPV] = None
+        self._last_pos_dispatch = 0.0
+        self._pending_pos: Optional[float] = None
+        self._pos_scheduled = False
+        # The UI event loop, bound by the app on mount so ticks can be posted without blocking mpv.
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set while the app can receive mpv events; cleared as soon as the app starts exiting.
+        self._active = threading.Event()
+        # The video loaded from a prefetched direct URL, kept so a failed load can fall back.
+        self._direct_video: Optional[VideoInfo] = None
         if not shutil.which('mpv'):
             logger.critical("FATAL: 'mpv' executable not found in PATH.")
             sys.exit(1)
@@ -173,8 +215,16 @@ class VideoPlayer:
             self.player = mpv.MPV(
                 ytdl=True,
                 ytdl_format=self.state.config.get('default_quality'),
+                # YouTube throttles single large requests; have lavf fetch in 10 MiB ranges instead.
+                # Needs an FFmpeg whose http protocol supports request_size.
+                stream_lavf_o='request_size=10485760',
                 cache=True,
-                cache_secs=15,
+                # A large demuxer cache keeps short +/-10s seeks inside buffered data.
+                # With the cache enabled, cache_secs also sets how far mpv reads ahead.
+                cache_secs=60,
+                demuxer_max_bytes='512MiB',
+                hr_seek='yes',
+                hr_seek_framedrop='no',
                 osc=True,
                 keep_open=True, # <-- THE DEFINITIVE FIX: Tells mpv not to exit after a file ends.
                 log_handler=self._mpv_log_handler,
@@ -185,34 +235,97 @@ class VideoPlayer:
             self.player.observe_property('pause', self._on_pause_change)
             self.player.observe_property('eof-reached', self._on_eof_reached)
             self.player.observe_property('duration', self._on_duration_change)
+            self.player.event_callback('end-file')(self._on_end_file)
             logger.info("MPV player initialized with keep_open=True for continuous playback.")
         except Exception as e:
             logger.error(f"Failed to initialize MPV player: {e}", exc_info=True)
             self.player = None
 
+    def attach(self, loop: asyncio.AbstractEventLoop):
+        """Bind the UI event loop and start forwarding mpv events to the app."""
+        self.loop = loop
+        self._active.set()
+
     def _on_time_pos_change(self, _, value):
-        if value is not None and self.app.is_running:
-            self.app.call_from_thread(self.app.sync_playback_timer, float(value))
+        if value is None or not self._active.is_set(): return
+        # Coalesce: a tick arriving while a flush is queued only overwrites the pending value.
+        self._pending_pos = float(value)
+        if self._pos_scheduled: return
+        self._pos_scheduled = True
+        # Rate-limit the flushes, not the values: inside the throttle window schedule a
+        # trailing flush so the latest position is always shown.
+        remaining = self._last_pos_dispatch + self.app.UI_UPDATE_INTERVAL - time.monotonic()
+        if remaining <= 0:
+            self.loop.call_soon_threadsafe(self._flush_pos)
+        else:
+            self.loop.call_soon_threadsafe(self.loop.call_later, remaining, self._flush_pos)
+
+    def _flush_pos(self):
+        self._pos_scheduled = False
+        self._last_pos_dispatch = time.monotonic()
+        position, self._pending_pos = self._pending_pos, None
+        if position is None: return
+        # Posted straight to the loop, outside Textual's handlers; log rather than let asyncio print over the TUI.
+        try: self.app.sync_playback_timer(position)
+        except Exception: logger.exception("Failed to apply playback position update.")
 
     def _on_duration_change(self, _, value):
-        if value is not None and self.app.is_running:
+        if value is not None and self._active.is_set():
             self.app.call_from_thread(self.app.sync_duration, float(value))
 
     def _on_pause_change(self, _, player_is_paused: bool):
-        if self.app.is_running:
+        if self._active.is_set():
             self.app.call_from_thread(self.app.sync_playback_status_from_player, player_is_paused)
 
     def _on_eof_reached(self, _, eof_is_reached: bool):
         """Hardened EOF handling."""
-        if eof_is_reached and self.state.autoplay_enabled and self.app.is_running:
+        if eof_is_reached and self.state.autoplay_enabled and self._active.is_set():
             # We only need to check if autoplay is enabled. The state machine will handle the rest.
             logger.info("EOF reached and autoplay is ON. Triggering next video.")
             self.app.call_from_thread(self.app.action_next_video)
 
-    def play(self, video: VideoInfo):
+    def _on_end_file(self, event):
+        """loadfile is async, so failed loads (direct URL or ytdl hook) only show up here."""
+        if not self._active.is_set() or event.data.reason != mpv.MpvEventEndFile.ERROR: return
+        video, self._direct_video = self._direct_video, None
+        if video is not None:
+            logger.warning(f"Direct stream failed for '{video.title}'; retrying via {video.url}")
+            try:
+                self.player.play(video.url)
+                return
+            except Exception as e: logger.error(f"MPV fallback failed for '{video.url}': {e}", exc_info=True)
+        else:
+            logger.error("MPV failed to load the current video.")
+        self.app.call_from_thread(self.app.handle_playback_error)
+
+    @staticmethod
+    def _quote_option(value: str) -> str:
+        # mpv's %n% syntax lets values contain commas and '=' inside loadfile options.
+        return f"%{len(value.encode())}%{value}"
+
+    def _direct_options(self, video: VideoInfo, stream: StreamInfo) -> Dict[str, str]:
+        options = {'force_media_title': self._quote_option(video.title)}
+        if stream.audio_url: options['audio_file'] = self._quote_option(stream.audio_url)
+        # Re-apply the format's headers, which mpv's ytdl hook would otherwise have set.
+        headers = dict(stream.http_headers)
+        user_agent = headers.pop('User-Agent', None)
+        if user_agent: options['user_agent'] = self._quote_option(user_agent)
+        if headers:
+            # http-header-fields is a comma-separated list, so commas inside values are escaped.
+            fields = ','.join(f"{k}: {v}".replace('\\', '\\\\').replace(',', '\\,') for k, v in headers.items())
+            options['http_header_fields'] = self._quote_option(fields)
+        return options
+
+    def play(self, video: VideoInfo, stream: Optional[StreamInfo] = None):
         if not self.player: return
+        if stream and stream.expired: stream = None
+        self._direct_video = video if stream else None
         try:
-            self.player.play(video.url)
+            if stream:
+                # A prefetched direct URL skips mpv's own ytdl resolution.
+                self.player.loadfile(stream.video_url, **self._direct_options(video, stream))
+            else:
+                self.player.play(video.url)
             self.player.pause = False
         except Exception as e:
             logger.error(f"MPV failed to play URL '{video.url}': {e}", exc_info=True)
@@ -225,38 +338,112 @@ class VideoPlayer:
     def seek(self, seconds: float):
         if self.player: self.player.seek(seconds, reference='relative')
 
+    def disarm(self):
+        """Stop forwarding mpv events to the app; safe to call more than once."""
+        self._active.clear()
+
     def cleanup(self):
+        self.disarm()
         if self.player:
             try: self.player.terminate()
             except Exception as e: logger.error(f"Error during MPV cleanup: {e}")
 
 class SearchEngine:
-    def __init__(self, state: AppState):
+    PREFETCH_CACHE_SIZE = 4
+
+    def __init__(self, state: AppState, executor: concurrent.futures.Executor, prefetch_executor: concurrent.futures.Executor):
         self.state = state
+        self.executor = executor
+        # Single-worker pool: keeps slow prefetches from starving searches and playback,
+        # and serializes access to _stream_ydl, since YoutubeDL is not thread-safe.
+        self.prefetch_executor = prefetch_executor
+        self._prefetching: set = set()
+        self.search_prefix = f'ytsearch{state.config.get("max_search_results", 25)}:'
         self.search_opts = {
             'quiet': True, 'no_warnings': True,
-            'default_search': f'ytsearch{state.config.get("max_search_results", 25)}:',
+            'default_search': self.search_prefix,
             'extract_flat': 'in_playlist'
         }
+        # The options never change, so one extractor instance is reused for every search.
+        self._ydl = yt_dlp.YoutubeDL(self.search_opts)
+        self._stream_ydl = yt_dlp.YoutubeDL({
+            'quiet': True, 'no_warnings': True,
+            'format': state.config.get('default_quality')
+        })
 
-    async def search(self, query: str) -> List[VideoInfo]:
-        if query in self.state.search_cache: return self.state.search_cache[query]
+    def _stream_entries(self, query: str, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        """Blocking network half of a search; runs on the I/O executor and feeds entries to `queue`."""
+        try:
+            # process=False hands back yt-dlp's lazy entries generator, so each entry can be
+            # forwarded as soon as it is parsed. The search prefix must be explicit in that mode.
+            info = self._ydl.extract_info(f"{self.search_prefix}{query}", download=False, process=False)
+            for entry in info.get('entries') or []:
+                if entry: loop.call_soon_threadsafe(queue.put_nowait, entry)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    async def search(self, query: str) -> AsyncIterator[List[VideoInfo]]:
+        """Yield results in batches: each batch is every entry that has arrived so far."""
+        cache = self.state.search_cache
+        hit = cache.get(query)
+        if hit is not None:
+            cache.move_to_end(query)
+            yield hit
+            return
         logger.info(f"Performing flat search for: '{query}'")
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        fetch = loop.run_in_executor(self.executor, self._stream_entries, query, loop, queue)
+        results: List[VideoInfo] = []
         try:
-            loop = asyncio.get_event_loop()
-            with yt_dlp.YoutubeDL(self.search_opts) as ydl:
-                info = await loop.run_in_executor(None, lambda: ydl.extract_info(query, download=False))
-            results = [
-                VideoInfo(id=e['id'], title=e.get('title', 'N/A'), uploader=e.get('uploader', 'N/A'), duration=e.get('duration'))
-                for e in info.get('entries', []) if e and e.get('id') and e.get('duration') is not None
-            ]
-            if len(self.state.search_cache) >= self.state.config['cache_size']:
-                self.state.search_cache.pop(next(iter(self.state.search_cache)))
-            self.state.search_cache[query] = results
-            return results
+            done = False
+            while not done:
+                # yt-dlp parses a whole results page at once, so drain everything already queued.
+                entries = [await queue.get()]
+                while not queue.empty(): entries.append(queue.get_nowait())
+                if entries[-1] is None:
+                    entries.pop()
+                    done = True
+                # Building VideoInfo objects is cheap CPU work, so it stays on the event loop.
+                batch = [VideoInfo.from_entry(e) for e in entries if e.get('id') and e.get('duration') is not None]
+                results.extend(batch)
+                if batch: yield batch
+            await fetch
         except Exception as e:
             logger.error(f"Search failed for '{query}': {e}", exc_info=True)
-            return []
+            return
+        cache[query] = results
+        if len(cache) > self.state.config['cache_size']:
+            cache.popitem(last=False)
+
+    async def prefetch(self, video: VideoInfo):
+        """Resolve a video's direct stream URLs ahead of time so playback can start immediately."""
+        cache = self.state.stream_cache
+        cached = cache.get(video.id)
+        if (cached and not cached.expired) or video.id in self._prefetching: return
+        self._prefetching.add(video.id)
+        try:
+            loop = asyncio.get_event_loop()
+            info = await loop.run_in_executor(self.prefetch_executor, lambda: self._stream_ydl.extract_info(video.url, download=False, process=True))
+        except Exception as e:
+            logger.warning(f"Prefetch failed for '{video.url}': {e}")
+            return
+        finally:
+            self._prefetching.discard(video.id)
+        stream = StreamInfo.from_info(info)
+        if stream is None: return
+        # Re-insert rather than overwrite so a refreshed (previously expired) entry counts as newest.
+        cache.pop(video.id, None)
+        cache[video.id] = stream
+        if len(cache) > self.PREFETCH_CACHE_SIZE:
+            cache.popitem(last=False)
+        logger.info(f"Prefetched stream for: '{video.title}'")
+
+    def cleanup(self):
+        try: self._ydl.close()
+        except Exception as e: logger.error(f"Error during yt-dlp cleanup: {e}")
+        try: self._stream_ydl.close()
+        except Exception as e: logger.error(f"Error during yt-dlp cleanup: {e}")
 
 # --- UI Widget Classes ---
 class NowPlayingWidget(Static):
@@ -280,7 +467,6 @@ class NowPlayingWidget(Static):
             title_label.update("No track loaded.")
             uploader_label.update("")
         self.query_one("#now-playing-status", Label).update(f"[b]Status:[/b] {state.playback_state.value}")
-        self.query_one("#now-playing-timer", Label).update(f"{self._format_time(state.position)} / {self._format_time(state.duration)}")
         queue_size = len(state.play_queue)
         queue_text = f"Queue: {queue_size} item{'s' if queue_size != 1 else ''}" if queue_size > 0 else "Queue: Empty"
         self.query_one("#queue-status", Label).update(queue_text)
@@ -311,9 +497,17 @@ class YouTubeCLI(App[None]):
     def __init__(self):
         super().__init__()
         self.state = AppState()
-        self.search_engine = SearchEngine(self.state)
+        # Dedicated pool for blocking yt-dlp/mpv calls, kept apart from the default executor.
+        self._io_exec = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="ytcli-io")
+        self._prefetch_exec = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="ytcli-prefetch")
+        self.search_engine = SearchEngine(self.state, self._io_exec, self._prefetch_exec)
         self.player = VideoPlayer(self.state, self)
-        self._last_ui_update_time = 0
+        self._last_pos_sec = -1
+        self._last_dur_sec = -1
+        self._prefetch_tasks: set = set()
+        self._loaded_video: Optional[VideoInfo] = None
+        self.bindings = list(self.BINDINGS)
+        self._autoplay_binding_idx = next(i for i, b in enumerate(self.BINDINGS) if b.key == 'a')
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -332,8 +526,14 @@ class YouTubeCLI(App[None]):
         table = self.query_one(DataTable)
         table.add_columns("Title", "Uploader", "Duration")
         table.cursor_type = "row"
+        self.player.attach(asyncio.get_running_loop())
         self.query_one(Input).focus()
-        self.update_ui_from_state()
+        self._now_playing = self.query_one(NowPlayingWidget)
+        self._timer_label = self.query_one("#now-playing-timer", Label)
+        self._volume_label = self.query_one("#volume-label", Label)
+        self._progress_bar = self.query_one("#progress-bar", ProgressBar)
+        self.update_ui_full()
+        self.update_autoplay_binding_description()
 
     def action_toggle_focus(self):
         """Toggle focus between the search input and the video table."""
@@ -342,24 +542,39 @@ class YouTubeCLI(App[None]):
         else:
             self.query_one(Input).focus()
         
+    def exit(self, *args, **kwargs) -> None:
+        # Textual tears down the DOM before on_unmount runs, so stop mpv callbacks now.
+        self.player.disarm()
+        super().exit(*args, **kwargs)
+
     def on_unmount(self) -> None:
         self.player.cleanup()
+        self.search_engine.cleanup()
+        self._io_exec.shutdown(wait=False)
+        self._prefetch_exec.shutdown(wait=False)
         self.state.save_config()
 
-    def update_ui_from_state(self):
-        self.query_one(NowPlayingWidget).update_all(self.state)
-        self.query_one("#volume-label").update(f"Volume: {self.state.volume}%")
-        progress_bar = self.query_one("#progress-bar", ProgressBar)
-        progress_bar.progress = (self.state.position / self.state.duration * 100) if self.state.duration > 0 else 0
-        self.update_autoplay_binding_description()
+    def update_ui_tick(self):
+        """Refresh only the widgets that change while a track is playing."""
+        position, duration = self.state.position, self.state.duration
+        # The timer only shows whole seconds, so skip re-renders that wouldn't change it.
+        pos_sec, dur_sec = int(position), int(duration)
+        if pos_sec == self._last_pos_sec and dur_sec == self._last_dur_sec: return
+        self._last_pos_sec, self._last_dur_sec = pos_sec, dur_sec
+        self._timer_label.update(f"{NowPlayingWidget._format_time(position)} / {NowPlayingWidget._format_time(duration)}")
+        self._progress_bar.progress = (position / duration * 100) if duration > 0 else 0
+
+    def update_ui_full(self):
+        """Refresh every stateful widget; used on state transitions."""
+        self._now_playing.update_all(self.state)
+        self._volume_label.update(f"Volume: {self.state.volume}%")
+        self.update_ui_tick()
 
     def update_autoplay_binding_description(self):
-        new_bindings = [
-            Binding(b.key, b.action, f"Autoplay [{'ON' if self.state.autoplay_enabled else 'OFF'}]", show=True, key_display=b.key_display)
-            if b.key == 'a' else b
-            for b in self.BINDINGS
-        ]
-        self.bindings = new_bindings
+        b = self.bindings[self._autoplay_binding_idx]
+        self.bindings[self._autoplay_binding_idx] = Binding(
+            b.key, b.action, f"Autoplay [{'ON' if self.state.autoplay_enabled else 'OFF'}]", show=True, key_display=b.key_display
+        )
 
     @on(Input.Submitted, "#search-input")
     async def on_search_submitted(self, event: Input.Submitted):
@@ -368,11 +583,16 @@ class YouTubeCLI(App[None]):
         table = self.query_one("#video-table", DataTable)
         table.clear()
         self.notify("Searching...", title="Search")
-        videos = await self.search_engine.search(query)
+        videos: List[VideoInfo] = []
         self.state.videos = videos
+        # Rows are added as results stream in, so the first ones show before the search finishes.
+        async for batch in self.search_engine.search(query):
+            # One refresh per arriving batch rather than per row.
+            with self.batch_update():
+                for video in batch:
+                    videos.append(video)
+                    table.add_row(video.title, video.uploader, video.formatted_duration, key=str(len(videos) - 1))
         if videos:
-            for i, video in enumerate(videos):
-                table.add_row(video.title, video.uploader, video.formatted_duration, key=str(i))
             self.notify(f"Found {len(videos)} videos.", title="Search Complete")
         else:
             self.notify("No videos found.", title="Search Failed", severity="warning")
@@ -384,41 +604,58 @@ class YouTubeCLI(App[None]):
 
     async def play_video(self, index: int):
         if not (0 <= index < len(self.state.videos)): return
+        video = self.state.videos[index]
+        # Re-selecting the video that is already loading or playing is a no-op.
+        if video is self._loaded_video and self.state.playback_state in (PlaybackState.PLAYING, PlaybackState.BUFFERING):
+            return
         
         self.state.current_video_index = index
-        video = self.state.videos[index]
+        self._loaded_video = video
         self.query_one("#video-table", DataTable).move_cursor(row=index, animate=True)
         
-        if self.state.set_playback_state(PlaybackState.BUFFERING): self.update_ui_from_state()
+        self.state.set_playback_state(PlaybackState.BUFFERING)
+        # Draw the new title and Buffering status before waiting on mpv.
+        self._now_playing.update_all(self.state)
         self.notify(f"Loading: {video.title}")
 
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self.player.play, video)
+        # Take the prefetched stream here on the loop; stream_cache is only touched from this thread.
+        stream = self.state.stream_cache.pop(video.id, None)
+        await loop.run_in_executor(self._io_exec, self.player.play, video, stream)
         
         if self.state.playback_state == PlaybackState.BUFFERING:
             if self.state.set_playback_state(PlaybackState.PLAYING):
-                self.update_ui_from_state()
+                self.update_ui_full()
+
+        if self.state.play_queue:
+            self.prefetch_video(self.state.play_queue[0][1])
+        if len(self.state.videos) > 1:
+            self.prefetch_video(self.state.videos[(index + 1) % len(self.state.videos)])
+
+    def prefetch_video(self, video: VideoInfo):
+        task = asyncio.create_task(self.search_engine.prefetch(video))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
 
     def sync_playback_timer(self, position: float):
-        now = time.monotonic()
-        if now - self._last_ui_update_time > self.UI_UPDATE_INTERVAL:
-            self.state.set_position(position)
-            self.update_ui_from_state()
-            self._last_ui_update_time = now
+        self.state.set_position(position)
+        self.update_ui_tick()
     
     def sync_duration(self, duration: float):
         self.state.set_duration(duration)
-        self.update_ui_from_state()
+        self.update_ui_tick()
     
     def sync_playback_status_from_player(self, player_is_paused: bool):
         current_app_state = self.state.playback_state
         if player_is_paused and current_app_state == PlaybackState.PLAYING:
-            if self.state.set_playback_state(PlaybackState.PAUSED): self.update_ui_from_state()
+            if self.state.set_playback_state(PlaybackState.PAUSED): self.update_ui_full()
         elif not player_is_paused and current_app_state == PlaybackState.PAUSED:
-            if self.state.set_playback_state(PlaybackState.PLAYING): self.update_ui_from_state()
+            if self.state.set_playback_state(PlaybackState.PLAYING): self.update_ui_full()
             
     def handle_playback_error(self):
-        if self.state.set_playback_state(PlaybackState.ERROR): self.update_ui_from_state()
+        # Let the failed video be selected again instead of matching play_video's no-op guard.
+        self._loaded_video = None
+        if self.state.set_playback_state(PlaybackState.ERROR): self.update_ui_full()
         self.notify(f"Failed to play video.", title="Playback Error", severity="error")
 
     def action_toggle_pause(self):
@@ -426,21 +663,22 @@ class YouTubeCLI(App[None]):
         if current_state == PlaybackState.PLAYING:
             if self.state.set_playback_state(PlaybackState.PAUSED):
                 self.player.set_pause(True)
-                self.update_ui_from_state()
+                self.update_ui_full()
         elif current_state == PlaybackState.PAUSED:
             if self.state.set_playback_state(PlaybackState.PLAYING):
                 self.player.set_pause(False)
-                self.update_ui_from_state()
+                self.update_ui_full()
 
     async def action_next_video(self):
-        next_video_from_queue = self.state.get_next_from_queue()
+        next_from_queue = self.state.get_next_from_queue()
         
-        if next_video_from_queue:
-            logger.info(f"Playing next from queue: {next_video_from_queue.title}")
-            try:
-                index = self.state.videos.index(next_video_from_queue)
+        if next_from_queue:
+            index, queued_video = next_from_queue
+            logger.info(f"Playing next from queue: {queued_video.title}")
+            # The stored index is only valid while the same search results are loaded.
+            if 0 <= index < len(self.state.videos) and self.state.videos[index] is queued_video:
                 await self.play_video(index)
-            except ValueError:
+            else:
                 logger.warning("Queued video not in current search results. Clearing queue.")
                 self.state.play_queue.clear()
                 await self.action_next_video()
@@ -452,7 +690,7 @@ class YouTubeCLI(App[None]):
                  if next_index != self.state.current_video_index: # Avoid replaying same song
                     await self.play_video(next_index)
         
-        self.update_ui_from_state()
+        self.update_ui_full()
 
     async def action_previous_video(self):
         if self.state.current_video_index is not None and len(self.state.videos) > 0:
@@ -462,17 +700,18 @@ class YouTubeCLI(App[None]):
     def action_toggle_autoplay(self):
         self.state.autoplay_enabled = not self.state.autoplay_enabled
         self.notify(f"Autoplay {'enabled' if self.state.autoplay_enabled else 'disabled'}.")
-        self.update_ui_from_state()
+        self.update_autoplay_binding_description()
+        self.update_ui_full()
 
     def action_volume_up(self, amount: int):
         if self.state.set_volume(self.state.volume + amount):
             self.player.set_volume(self.state.volume)
-            self.update_ui_from_state()
+            self.update_ui_full()
 
     def action_volume_down(self, amount: int):
         if self.state.set_volume(self.state.volume - amount):
             self.player.set_volume(self.state.volume)
-            self.update_ui_from_state()
+            self.update_ui_full()
 
     def action_seek_forward(self, seconds: int): self.player.seek(seconds)
     def action_seek_back(self, seconds: int): self.player.seek(-seconds)
@@ -482,9 +721,10 @@ class YouTubeCLI(App[None]):
         cursor_row = table.cursor_row
         if 0 <= cursor_row < len(self.state.videos):
             video_to_queue = self.state.videos[cursor_row]
-            self.state.add_to_queue(video_to_queue)
+            self.state.add_to_queue(cursor_row, video_to_queue)
+            self.prefetch_video(video_to_queue)
             self.notify(f"Queued: {video_to_queue.title}")
-            self.update_ui_from_state()
+            self.update_ui_full()
 
     def action_toggle_focus(self):
         if self.state.focus_mode == "search":